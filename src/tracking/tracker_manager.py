@@ -257,6 +257,10 @@ class TrackerManager:
     # Failure detection thresholds
     MAX_SIZE_CHANGE_FACTOR = 0.20   # 20% size change between frames
     MAX_CENTER_SHIFT_FACTOR = 0.10  # 10% center shift relative to box size
+
+    # get_frame decodes forward instead of seeking for jumps up to this many
+    # frames; a seek restarts decoding from the previous keyframe
+    MAX_FORWARD_GRAB = 30
     
     def __init__(self):
         self.players: Dict[int, PlayerData] = {}
@@ -416,8 +420,11 @@ class TrackerManager:
     def get_frame(self, frame_idx):
         if self.video_path is None or frame_idx < 0: return None
         if self.video_cap and self.video_cap.isOpened():
-            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-            ret, frame = self.video_cap.read()
+            cap = self.video_cap
+            skip = frame_idx - int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+            if not (0 <= skip <= self.MAX_FORWARD_GRAB and all(cap.grab() for _ in range(skip))):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            ret, frame = cap.read()
             if ret: return frame
         return None
     
@@ -536,7 +543,7 @@ class TrackerManager:
             print(f"⚠️ Ball reacquisition error: {e}")
             return None
     
-    def generate_tracking_data(self, start_frame=0, end_frame=None, progress_callback=None):
+    def generate_tracking_data(self, start_frame=0, end_frame=None, progress_callback=None, frame_stride=1):
         if self.video_path is None: raise ValueError("No video loaded")
         if end_frame is None: end_frame = self.total_frames - 1
         resume_start = self.get_resume_start(start_frame)
@@ -571,7 +578,20 @@ class TrackerManager:
         frames_lost: Dict[int, int] = {}
         last_good_bbox: Dict[int, Tuple[int, int, int, int]] = {}
 
+        # With frame_stride > 1 only every Nth frame is decoded and tracked;
+        # manually marked and first-appearance frames are always kept
+        frame_stride = max(1, int(frame_stride))
+        required_frames = set()
+        if frame_stride > 1:
+            for player in self.players.values():
+                required_frames.update(player.learning_frames)
+                required_frames.add(player.initial_frame)
+
         for f_idx in range(resume_start, end_frame + 1):
+            if (f_idx - resume_start) % frame_stride and f_idx not in required_frames:
+                # Advance the demuxer without retrieving/converting the frame
+                if not cap.grab(): break
+                continue
             ret, frame = cap.read()
             if not ret: break
             if progress_callback: progress_callback(f_idx - resume_start + 1, end_frame - resume_start + 1)
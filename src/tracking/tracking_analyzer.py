@@ -44,10 +44,38 @@ class TrackingAnalyzer:
         Returns:
             List of TrackingIssue objects, sorted by frame index
         """
+        return self._scan(tracking_data, frame_width, frame_height)[0]
+
+    def analyze_full(self, tracking_data: Dict[int, Dict[str, any]],
+                     frame_width: int, frame_height: int) -> Tuple[List[TrackingIssue], Dict[str, any], float]:
+        """
+        Analyze tracking data, summarize issues and score quality in one pass
+
+        Equivalent to analyze() + get_summary() + calculate_tracking_quality_score(),
+        but walks tracking_data only once.
+
+        Args:
+            tracking_data: Dictionary {frame_idx: {'bbox': ..., 'confidence': ..., 'is_learning_frame': ...}}
+            frame_width: Video frame width
+            frame_height: Video frame height
+
+        Returns:
+            Tuple of (issues, summary, quality_score)
+        """
+        issues, lost_frames, confidence_sum = self._scan(tracking_data, frame_width, frame_height)
+        summary = self.get_summary(issues)
+        score = self._quality_score(len(tracking_data), lost_frames, confidence_sum, issues)
+        return issues, summary, score
+
+    def _scan(self, tracking_data: Dict[int, Dict[str, any]],
+              frame_width: int, frame_height: int) -> Tuple[List[TrackingIssue], int, float]:
+        """Single pass over tracking data: (issues, lost frame count, confidence sum)"""
         issues = []
+        lost_frames = 0
+        confidence_sum = 0.0
 
         if not tracking_data:
-            return issues
+            return issues, lost_frames, confidence_sum
 
         frames = sorted(tracking_data.keys())
         prev_bbox = None
@@ -59,6 +87,11 @@ class TrackingAnalyzer:
             confidence = data.get('confidence', 0.0)
             is_learning = data.get('is_learning_frame', False)
 
+            # Quality score inputs cover every frame, learning frames included
+            if bbox is None:
+                lost_frames += 1
+            confidence_sum += confidence
+
             # Skip learning frames (they're manually marked, so they're correct)
             if is_learning:
                 prev_bbox = bbox
@@ -168,7 +201,7 @@ class TrackingAnalyzer:
             prev_bbox = bbox
             prev_frame_idx = frame_idx
 
-        return issues
+        return issues, lost_frames, confidence_sum
 
     def get_summary(self, issues: List[TrackingIssue]) -> Dict[str, any]:
         """
@@ -305,18 +338,30 @@ class TrackingAnalyzer:
         if not tracking_data:
             return 0.0
 
-        total_frames = len(tracking_data)
+        lost_frames = 0
+        confidence_sum = 0.0
+        for d in tracking_data.values():
+            if d['bbox'] is None:
+                lost_frames += 1
+            confidence_sum += d['confidence']
+
+        return self._quality_score(len(tracking_data), lost_frames, confidence_sum, issues)
+
+    def _quality_score(self, total_frames: int, lost_frames: int, confidence_sum: float,
+                       issues: List[TrackingIssue]) -> float:
+        """Quality score from per-frame aggregates (see calculate_tracking_quality_score)"""
+        if total_frames == 0:
+            return 0.0
 
         # Start with perfect score
         score = 1.0
 
         # Penalty for lost frames
-        lost_frames = len([f for f, d in tracking_data.items() if d['bbox'] is None])
         lost_penalty = (lost_frames / total_frames) * 0.5
         score -= lost_penalty
 
         # Penalty for low confidence
-        avg_confidence = sum([d['confidence'] for d in tracking_data.values()]) / total_frames
+        avg_confidence = confidence_sum / total_frames
         confidence_penalty = (1.0 - avg_confidence) * 0.3
         score -= confidence_penalty
 
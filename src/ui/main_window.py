@@ -1208,6 +1208,7 @@ class MainWindow(QMainWindow):
         
         # Show current project's markers if any
         if project.has_players():
+            self.video_canvas.begin_batch()
             for player in project.get_players():
                 if player.current_bbox:
                     self.video_canvas.add_bbox(
@@ -1216,6 +1217,7 @@ class MainWindow(QMainWindow):
                         player.marker_style,
                         player.color
                     )
+            self.video_canvas.end_batch()
         
         # Update buttons and frame info
         self._update_tracking_range_info()
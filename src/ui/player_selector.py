@@ -246,8 +246,8 @@ class PlayerSelector(QDialog):
         h, w, ch = rgb_frame.shape
         bytes_per_line = ch * w
         
-        qt_image = QImage(rgb_frame.data.tobytes(), w, h, bytes_per_line, 
-                         QImage.Format.Format_RGB888).copy()
+        # fromImage copies the pixels, so wrapping rgb_frame's buffer is enough
+        qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
         
         pixmap = QPixmap.fromImage(qt_image)
         
@@ -201,6 +201,10 @@ class ConfidenceGraph(QWidget):
         self.tracking_data = {}
         self.player_id = None
         self.current_frame = 0
+        # Per-frame arrays, rebuilt in set_data so repaints never walk the dict
+        self._frames = np.empty(0, dtype=np.int64)
+        self._confidences = np.empty(0, dtype=np.float64)
+        self._learning = np.empty(0, dtype=bool)
         self.setMinimumHeight(120)
         self.setMaximumHeight(200)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -209,6 +213,14 @@ class ConfidenceGraph(QWidget):
         """Set tracking data to display"""
         self.tracking_data = tracking_data
         self.player_id = player_id
+
+        frames = sorted(tracking_data.keys()) if tracking_data else []
+        count = len(frames)
+        self._frames = np.fromiter(frames, dtype=np.int64, count=count)
+        self._confidences = np.fromiter(
+            (tracking_data[f].get('confidence', 0.0) for f in frames), dtype=np.float64, count=count)
+        self._learning = np.fromiter(
+            (tracking_data[f].get('is_learning_frame', False) for f in frames), dtype=bool, count=count)
         self.update()
 
     def set_current_frame(self, frame_idx: int):
@@ -236,13 +248,13 @@ class ConfidenceGraph(QWidget):
             return
 
         # Get frame range
-        frames = sorted(self.tracking_data.keys())
-        if not frames:
+        frames = self._frames
+        if not frames.size:
             painter.end()
             return
 
-        min_frame = min(frames)
-        max_frame = max(frames)
+        min_frame = int(frames[0])
+        max_frame = int(frames[-1])
         frame_range = max_frame - min_frame
 
         if frame_range == 0:
@@ -284,14 +296,11 @@ class ConfidenceGraph(QWidget):
             painter.drawText(5, y + 5, f"{i/100:.1f}")
 
         # Calculate points
-        points = []
-        for frame_idx in frames:
-            data = self.tracking_data[frame_idx]
-            confidence = data.get('confidence', 0.0)
-
-            x = margin + int((frame_idx - min_frame) / frame_range * graph_width)
-            y = margin + int((1 - confidence) * graph_height)
-            points.append((x, y, confidence, frame_idx, data.get('is_learning_frame', False)))
+        confidences = self._confidences
+        xs = margin + ((frames - min_frame) / frame_range * graph_width).astype(np.int64)
+        ys = margin + ((1 - confidences) * graph_height).astype(np.int64)
+        points = list(zip(xs.tolist(), ys.tolist(), confidences.tolist(),
+                          frames.tolist(), self._learning.tolist()))
 
         # Draw confidence line with gradient effect
         painter.setPen(QPen(QColor(0, 200, 255), 3))
@@ -355,12 +364,12 @@ class ConfidenceGraph(QWidget):
         if not self.tracking_data:
             return
 
-        frames = sorted(self.tracking_data.keys())
-        if not frames:
+        frames = self._frames
+        if not frames.size:
             return
 
-        min_frame = min(frames)
-        max_frame = max(frames)
+        min_frame = int(frames[0])
+        max_frame = int(frames[-1])
         frame_range = max_frame - min_frame
 
         if frame_range == 0:
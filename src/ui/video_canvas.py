@@ -2,13 +2,70 @@
 Video Canvas - Widget for displaying video and drawing bounding boxes
 Supports zoom with Cmd/Ctrl+Scroll for enhanced detection
 """
-from PyQt6.QtWidgets import QWidget, QLabel, QApplication
-from PyQt6.QtCore import Qt, QRect, QPoint, QPointF, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage, QPainter, QPen, QColor, QFont, QWheelEvent
+from PyQt6.QtWidgets import QWidget, QLabel
+from PyQt6.QtCore import (Qt, QCoreApplication, QEvent, QObject, QRect, QRectF, QPoint, QPointF, QSize,
+                          QThread, QTimer, pyqtSignal, pyqtSlot)
+from PyQt6.QtGui import (QPixmap, QImage, QPainter, QPainterPath, QPen, QBrush, QColor, QFont,
+                         QFontMetrics, QPolygon, QWheelEvent)
 import cv2
+import logging
+import math
 import numpy as np
 from typing import Optional, Tuple, List
 
+logger = logging.getLogger(__name__)
+
+# Format_BGR888 (Qt >= 5.14) lets Qt read OpenCV's channel order directly
+HAVE_BGR888 = hasattr(QImage.Format, 'Format_BGR888')
+
+# Detection boxes narrower than this (display px) are drawn without a label
+DETECTION_LABEL_MIN_WIDTH = 40
+
+# Radar preview grid: distance arcs at these fractions of the cone length and
+# radial lines at these fractions of the cone's opening angle
+_RADAR_ARC_FRACTIONS = np.arange(1, 5) / 4
+_RADAR_RADIAL_T = np.arange(6) / 5
+# Half size of the pre-rendered radar origin marker (radius 8 + outline)
+_RADAR_ORIGIN_HALF = 11
+
+
+def _bgr_to_qimage(frame: np.ndarray) -> QImage:
+    """Wrap a contiguous BGR uint8 array as a QImage
+    
+    With Format_BGR888 the QImage shares frame's memory, so frame must stay
+    alive until the image is converted (e.g. by QPixmap.fromImage). Older Qt
+    builds fall back to Qt's own byte swap, which returns an owning copy.
+    """
+    h, w = frame.shape[:2]
+    if HAVE_BGR888:
+        return QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+    return QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_RGB888).rgbSwapped()
+
+
+class _FrameConverter(QObject):
+    """Resize frame crops to display size off the GUI thread
+    
+    One instance lives on a worker QThread for the lifetime of its canvas.
+    Results are owning RGB32 QImages (the raster pixmap format), so the GUI
+    thread only has to adopt them with QPixmap.fromImage.
+    """
+    converted = pyqtSignal(object, object, QImage)  # frame, visible_region, image
+    
+    @pyqtSlot(object, object, object, int, object)
+    def convert(self, frame: np.ndarray, crop: Tuple[int, int, int, int],
+                size: Tuple[int, int], interpolation: int,
+                visible_region: Tuple[float, float, float, float]):
+        x1, y1, x2, y2 = crop
+        resized = cv2.resize(frame[y1:y2, x1:x2], size, interpolation=interpolation)
+        image = _bgr_to_qimage(resized).convertToFormat(QImage.Format.Format_RGB32)
+        self.converted.emit(frame, visible_region, image)
+
+
+def _stop_thread(thread: QThread):
+    """Quit a worker thread's event loop and wait for it to exit"""
+    thread.quit()
+    thread.wait()
+
 
 class VideoCanvas(QLabel):
     """Canvas for displaying video frames and drawing bounding boxes
@@ -27,6 +84,8 @@ class VideoCanvas(QLabel):
     zoom_changed = pyqtSignal(float, tuple)  # zoom_level, visible_region (x, y, w, h)
     zoom_detection_requested = pyqtSignal(np.ndarray, tuple)  # cropped_frame, original_region
     radar_direction_set = pyqtSignal(float)  # angle in radians
+    # Queued to the _FrameConverter worker: frame, crop, size, interpolation, visible_region
+    _conversion_requested = pyqtSignal(object, object, object, int, object)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -44,13 +103,100 @@ class VideoCanvas(QLabel):
         # Detection state
         self.detection_mode = False  # True when showing detected people
         self.detected_people = []  # List of (x, y, w, h, confidence) for detected people
-        self.detected_bboxes_display = []  # List of (x, y, w, h) for display
+        self.detected_bboxes_display = np.empty((0, 4), dtype=np.int32)  # (N, 4) x, y, w, h for display
+        self._detected_conf = np.empty(0)  # (N,) confidence per detection
         
         # Video frame
         self.current_frame = None
+        self._frame_h, self._frame_w = 0, 0  # current_frame.shape[:2], set in set_frame
         self.scale_factor = 1.0
         self.offset_x = 0
         self.offset_y = 0
+        self._visible_region = (0, 0, 1, 1)  # Region the shown pixmap was built from
+
+        # Cached scaled frame - rebuilt only when the frame, widget size or
+        # visible region changes, so overlay-only updates skip the rescale
+        self._base_scaled_pixmap = None
+        self._base_region = None
+        self._base_smooth = False  # False when built with FastTransformation
+        self._frame_dirty = True
+        self._size_dirty = True
+        self._base_crop = None  # (x1, y1, x2, y2) frame crop the base was scaled from
+        self._base_frame_size = None
+        self._base_interpolation = None
+        
+        # New frames with unchanged geometry are scaled by one long-lived
+        # worker on its own thread; one conversion is in flight at a time and
+        # only the newest waiting one is kept
+        self._converter = _FrameConverter()
+        self._converter_thread = QThread()
+        self._converter.moveToThread(self._converter_thread)
+        self._conversion_requested.connect(self._converter.convert)
+        self._converter.converted.connect(self._on_frame_converted)
+        self._converter_busy = False
+        self._queued_conversion = None  # Newest waiting _conversion_requested args
+        self._converter_frame = None  # Frame being converted (or queued)
+        self._converter_thread.start()
+        # Stop the thread with the canvas or the app, whichever goes first.
+        # The lambdas hold the thread and worker so they outlive the canvas
+        stop_converter = lambda *_, t=self._converter_thread, w=self._converter: _stop_thread(t)
+        self.destroyed.connect(stop_converter)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(stop_converter)
+        
+        # Display-space (x, y, w, h) int32 arrays for the bbox lists,
+        # recomputed lazily after _invalidate_scaled_cache()
+        self._scaled_displayed = None
+        self._scaled_detected = None
+        self._ellipse_rects = None  # 'circle' style hoop rects, rebuilt with _scaled_displayed
+        
+        # Wheel zoom is applied at most once per ~16 ms from the summed deltas
+        self._wheel_delta = 0
+        self._wheel_pos = None
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)
+        self._wheel_timer.timeout.connect(self._apply_wheel_zoom)
+        
+        # Last mouse position acted on by mouseMoveEvent (sub-pixel moves are ignored)
+        self._last_mouse_pos = None
+        
+        # Deferred repaints share one single-shot timer: state changes are
+        # coalesced into one paint per event-loop pass (_request_update) and
+        # mouse-move repaints to at most one per ~16 ms (_request_repaint)
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._run_pending_update)
+        # Area touched by the pending partial repaints (canvas coordinates);
+        # any request without a rect forces a full repaint
+        self._dirty_rect = None
+        self._dirty_all = False
+        
+        # Working canvas and painter reused by every _update_display; the
+        # canvas is only reallocated when the scaled frame size changes.
+        # paintEvent blits it straight to the widget at (offset_x, offset_y)
+        self._canvas_image = None
+        self._overlay_painter = QPainter()
+        
+        # Paint resources reused across repaints
+        self._detection_pen = QPen(QColor(0, 255, 0))
+        self._detection_pen.setWidth(3)
+        self._detection_text_pen = QPen(QColor(0, 255, 0))
+        self._white_pen = QPen(QColor(255, 255, 255))
+        self._text_bg_color = QColor(0, 0, 0, 180)
+        self._font_metrics = QFontMetrics(self.font())  # Rebuilt in changeEvent
+        self._text_height = self._font_metrics.height()
+        self._text_width_cache = {}  # label -> horizontal advance, cleared on font change
+        self._zoom_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._zoom_font_metrics = QFontMetrics(self._zoom_font)
+        self._zoom_border_pen = QPen(QColor(100, 200, 255))
+        self._minimap_bg_color = QColor(0, 0, 0, 150)
+        self._minimap_frame_pen = QPen(QColor(100, 100, 100))
+        self._minimap_view_pen = QPen(QColor(255, 200, 0), 2)
+        self._pen_cache = {}  # (rgb, width) -> QPen, see _pen()
+        # Minimap thumbnail, built once per frame on first use
+        self._minimap_pixmap = None
         
         # ===== ZOOM STATE =====
         self.zoom_level = 1.0  # 1.0 = 100%, 2.0 = 200%, etc.
@@ -58,6 +204,14 @@ class VideoCanvas(QLabel):
         self.max_zoom = 8.0
         self.zoom_step = 0.15  # How much to zoom per scroll tick
         
+        # Cmd/Ctrl + key zoom shortcuts
+        self._zoom_key_actions = {
+            Qt.Key.Key_Plus: lambda: self.set_zoom(self.zoom_level * 1.25, self.pan_x, self.pan_y),
+            Qt.Key.Key_Equal: lambda: self.set_zoom(self.zoom_level * 1.25, self.pan_x, self.pan_y),
+            Qt.Key.Key_Minus: lambda: self.set_zoom(self.zoom_level / 1.25, self.pan_x, self.pan_y),
+            Qt.Key.Key_0: self.reset_zoom,
+        }
+        
         # Pan offset (in original frame coordinates)
         self.pan_x = 0.0  # Center X of visible region
         self.pan_y = 0.0  # Center Y of visible region
@@ -79,24 +233,43 @@ class VideoCanvas(QLabel):
         self.radar_preview_angle = None  # Current preview angle
         self.radar_mouse_pos = None  # Current mouse position for preview
         self.radar_preview_size = 1.0  # Size multiplier (scroll to change)
+        # Geometry of the last radar preview, reused while the cone is unchanged
+        self._radar_geometry_key = None
+        self._radar_geometry_cache = None
+        self._radar_drawn_rect = None  # Canvas area the last preview painted into
+        self._radar_banner_pixmap = None  # Instruction text, rendered on first use
+        self._radar_banner_ascent = 0
+        self._radar_origin_pixmap = None  # Origin marker, rendered on first use
     
-    def set_frame(self, frame: np.ndarray, reset_zoom: bool = False):
+    def set_frame(self, frame: np.ndarray, reset_zoom: bool = False, copy: bool = False):
         """
         Set frame to display
         
         Args:
             frame: Frame as numpy array (BGR format)
             reset_zoom: If True, reset zoom to 100%
+            copy: If True, store a private copy. Leave False when the caller
+                  hands over a fresh buffer (e.g. VideoCapture.read() output)
+                  that it will not modify afterwards
+        
+        Re-delivering the buffer that is already displayed is a no-op, so
+        callers that edit a frame in place must pass a new array to refresh.
         """
         if frame is None:
-            print("VideoCanvas.set_frame: frame is None!")
+            logger.debug("VideoCanvas.set_frame: frame is None")
             return
         
-        self.current_frame = frame.copy()
+        if not reset_zoom and self._is_current_buffer(frame):
+            return
+        
+        self.current_frame = frame.copy() if copy else frame
+        self._frame_h, self._frame_w = frame.shape[:2]
+        self._frame_dirty = True
+        self._minimap_pixmap = None
         
         # Initialize pan center if not set
         if self.pan_x == 0.0 and self.pan_y == 0.0:
-            h, w = frame.shape[:2]
+            h, w = self._frame_h, self._frame_w
             self.pan_x = w / 2
             self.pan_y = h / 2
         
@@ -105,18 +278,202 @@ class VideoCanvas(QLabel):
         else:
             self._update_display()
     
-    def _update_display(self):
-        """Update the displayed image with zoom and pan support"""
+    def _is_current_buffer(self, frame: np.ndarray) -> bool:
+        """True if frame views exactly the same memory as current_frame"""
+        current = self.current_frame
+        if current is None:
+            return False
+        if frame is current:
+            return True
+        return (frame.ctypes.data == current.ctypes.data and
+                frame.shape == current.shape and frame.strides == current.strides)
+    
+    def _update_display(self, clip: Optional[QRect] = None):
+        """Update the displayed image with zoom and pan support
+        
+        If clip is given, only that canvas area is repainted and pushed to
+        the screen (used when nothing outside it has changed).
+        """
+        # Painting now satisfies any deferred request
+        self._update_timer.stop()
+        self._dirty_rect = None
+        self._dirty_all = False
         if self.current_frame is None:
             return
         
-        frame_h, frame_w = self.current_frame.shape[:2]
-        widget_size = self.size()
-        
         # Calculate visible region in original frame coordinates
         visible_region = self._get_visible_region()
         vx, vy, vw, vh = visible_region
         
+        # Scale quickly while dragging/panning, upgrade to smooth once idle
+        smooth = not (self.drawing or self.panning)
+        
+        if (self._frame_dirty or self._size_dirty or
+                self._base_scaled_pixmap is None or visible_region != self._base_region or
+                (smooth and not self._base_smooth)):
+            if self._can_convert_in_background(visible_region, smooth):
+                # Only the pixels changed - _on_frame_converted repaints once ready
+                self._convert_in_background()
+                return
+            if not self._rebuild_base_pixmap(visible_region, smooth):
+                return
+            clip = None
+        
+        # Overlays are painted onto a separate canvas so the cached base stays clean.
+        # ARGB32_Premultiplied is QPainter's fastest target format.
+        if self._canvas_image is None or self._canvas_image.size() != self._base_scaled_pixmap.size():
+            self._canvas_image = QImage(self._base_scaled_pixmap.size(),
+                                        QImage.Format.Format_ARGB32_Premultiplied)
+            self.updateGeometry()  # sizeHint follows the canvas size
+            clip = None
+        canvas = self._canvas_image
+        
+        if self._scaled_displayed is None:
+            self._scaled_displayed = self._boxes_to_display(
+                [bbox_data[:4] for bbox_data in self.displayed_bboxes])
+            self._ellipse_rects = self._hoop_rects(self._scaled_displayed)
+        if self._scaled_detected is None:
+            self._scaled_detected = self._boxes_to_display(self.detected_bboxes_display)
+        
+        # Start overlay painting (begin() resets pen, font and hints)
+        painter = self._overlay_painter
+        if clip is not None and self.radar_edit_mode and self.radar_player_bbox and self.radar_mouse_pos:
+            # The radar preview follows the mouse - repaint its new area too
+            clip = clip.united(self._radar_geometry()[-1])
+        
+        painter.begin(canvas)
+        if clip is not None:
+            painter.setClipRect(clip)
+        # The base frame is opaque and covers the canvas, so it is copied
+        # without blending; overlays then composite normally on top
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawPixmap(0, 0, self._base_scaled_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())  # Labels are measured with self._font_metrics
+        
+        # Draw detected people (adjusted for zoom)
+        if self.detection_mode and len(self.detected_bboxes_display):
+            # Skip boxes outside the visible region
+            boxes = self.detected_bboxes_display
+            bx, by = boxes[:, 0], boxes[:, 1]
+            visible = np.flatnonzero((bx + boxes[:, 2] >= vx) & (bx <= vx + vw) &
+                                     (by + boxes[:, 3] >= vy) & (by <= vy + vh))
+            
+            # All detection boxes share one pen - submit them in a single call
+            scaled_visible = self._scaled_detected[visible].tolist()
+            painter.setPen(self._detection_pen)
+            painter.drawRects([QRect(*rect) for rect in scaled_visible])
+            
+            # Draw labels
+            painter.setPen(self._detection_text_pen)
+            for i, (sx, sy, sw, sh) in zip(visible.tolist(), scaled_visible):
+                if sw < DETECTION_LABEL_MIN_WIDTH:
+                    continue  # Label would be wider than the box and unreadable
+                conf = self._detected_conf[i]
+                conf_text = f"Person {i+1} ({conf:.0%})"
+                text_w = self._text_width(conf_text)
+                text_h = self._text_height
+                text_x = sx + (sw - text_w) // 2
+                text_y = sy - 10 if sy > 30 else sy + sh + 20
+                
+                painter.fillRect(text_x - 2, text_y - text_h - 2, text_w + 4, text_h + 4,
+                                 self._text_bg_color)
+                painter.drawText(text_x, text_y - 2, conf_text)
+        
+        # Draw existing bboxes - plain rectangles are batched per color first,
+        # then other marker styles and all name labels are drawn per bbox
+        rects_by_color = {}
+        for bbox_data, scaled in zip(self.displayed_bboxes, self._scaled_displayed.tolist()):
+            if bbox_data[5] == 'rectangle':
+                rects_by_color.setdefault(bbox_data[6], []).append(QRect(*scaled))
+        for color, rects in rects_by_color.items():
+            painter.setPen(self._pen(color, 2))
+            painter.drawRects(rects)
+        
+        for bbox_data, scaled, ellipse_rect in zip(self.displayed_bboxes,
+                                                   self._scaled_displayed.tolist(),
+                                                   self._ellipse_rects.tolist()):
+            name, style, color = bbox_data[4:]
+            if style == 'rectangle':
+                style = None  # Already drawn above, only the label remains
+            self._draw_bbox_on_pixmap(painter, *scaled, name, style, color, ellipse_rect)
+        
+        # Draw current bbox being drawn
+        if self.current_bbox:
+            scaled = self._boxes_to_display([self.current_bbox])[0].tolist()
+            self._draw_bbox_on_pixmap(painter, *scaled, "", "rectangle", (255, 255, 255))
+        
+        # Draw zoom indicator
+        if self.show_zoom_indicator and self.zoom_level > 1.0:
+            self._draw_zoom_indicator(painter, canvas.width(), canvas.height(), visible_region)
+
+        # Draw radar preview if in radar edit mode
+        if self.radar_edit_mode and self.radar_player_bbox and self.radar_mouse_pos:
+            self._draw_radar_preview(painter)
+
+        painter.end()
+        
+        # paintEvent draws the canvas directly - no per-repaint QPixmap copy
+        if clip is None:
+            self.update()
+        else:
+            self.update(clip.translated(self.offset_x, self.offset_y))
+    
+    def paintEvent(self, event):
+        """Draw the label frame, then blit the composed canvas"""
+        super().paintEvent(event)
+        if self._canvas_image is not None:
+            painter = QPainter(self)
+            painter.drawImage(self.offset_x, self.offset_y, self._canvas_image)
+            painter.end()
+    
+    def sizeHint(self) -> QSize:
+        """Size of the shown frame, as QLabel reports for a pixmap"""
+        if self._canvas_image is None:
+            return super().sizeHint()
+        frame = 2 * self.frameWidth()
+        return self._canvas_image.size() + QSize(frame, frame)
+    
+    def _schedule_update(self, delay_ms: int, dirty: Optional[QRect] = None):
+        """Start the deferred-repaint timer unless it will already fire sooner
+        
+        dirty limits the repaint to a canvas rect; None repaints everything.
+        """
+        if dirty is None:
+            self._dirty_all = True
+        elif self._dirty_rect is None:
+            self._dirty_rect = dirty
+        else:
+            self._dirty_rect = self._dirty_rect.united(dirty)
+        timer = self._update_timer
+        if not timer.isActive() or timer.remainingTime() > delay_ms:
+            timer.start(delay_ms)
+    
+    def _request_update(self):
+        """Coalesce state-change repaints into one per event-loop iteration"""
+        self._schedule_update(0)
+    
+    def _request_repaint(self, dirty: Optional[QRect] = None):
+        """Schedule a throttled _update_display (used by high-rate mouse events)"""
+        self._schedule_update(16, dirty)
+    
+    def _run_pending_update(self):
+        """Paint everything requested since the last _update_display"""
+        self._update_display(None if self._dirty_all else self._dirty_rect)
+    
+    def _flush_pending_update(self):
+        """Run a deferred repaint now, if one is scheduled"""
+        if self._update_timer.isActive():
+            self._run_pending_update()
+    
+    def _rebuild_base_pixmap(self, visible_region: Tuple[float, float, float, float],
+                             smooth: bool = True) -> bool:
+        """Crop and scale the current frame to the widget, caching the result"""
+        frame_h, frame_w = self._frame_h, self._frame_w
+        widget_size = self.size()
+        vx, vy, vw, vh = visible_region
+        
         # Crop frame to visible region
         x1 = max(0, int(vx))
         y1 = max(0, int(vy))
@@ -126,33 +483,35 @@ class VideoCanvas(QLabel):
         cropped_frame = self.current_frame[y1:y2, x1:x2]
         
         if cropped_frame.size == 0:
-            return
+            return False
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(cropped_frame, cv2.COLOR_BGR2RGB)
-        ch_h, ch_w, ch = rgb_frame.shape
-        bytes_per_line = ch * ch_w
+        # Scale to fit widget
+        crop_h, crop_w = cropped_frame.shape[:2]
+        scale_w = widget_size.width() / crop_w
+        scale_h = widget_size.height() / crop_h
+        display_scale = min(scale_w, scale_h)
+        target_w = max(1, int(crop_w * display_scale))
+        target_h = max(1, int(crop_h * display_scale))
+        
+        # Resize with OpenCV before handing pixels to Qt - INTER_AREA gives a
+        # clean downscale, INTER_LINEAR a smooth zoomed-in upscale, and
+        # INTER_NEAREST is the cheap preview while dragging
+        if not smooth:
+            interpolation = cv2.INTER_NEAREST
+        elif display_scale < 1.0:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LINEAR
+        display_frame = cv2.resize(cropped_frame, (target_w, target_h), interpolation=interpolation)
         
-        # Create QImage
-        qt_image = QImage(rgb_frame.data.tobytes(), ch_w, ch_h, bytes_per_line, 
-                         QImage.Format.Format_RGB888).copy()
+        # The resized buffer is wrapped without a channel swap - display_frame
+        # stays alive in this scope until fromImage() copies it
+        qt_image = _bgr_to_qimage(display_frame)
         
         if qt_image.isNull():
-            return
+            return False
         
-        pixmap = QPixmap.fromImage(qt_image)
-        
-        # Scale to fit widget
-        scale_w = widget_size.width() / pixmap.width() if pixmap.width() > 0 else 1.0
-        scale_h = widget_size.height() / pixmap.height() if pixmap.height() > 0 else 1.0
-        display_scale = min(scale_w, scale_h)
-        
-        scaled_pixmap = pixmap.scaled(
-            int(pixmap.width() * display_scale),
-            int(pixmap.height() * display_scale),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        ).copy()
+        scaled_pixmap = QPixmap.fromImage(qt_image)
         
         # Store scale factor for coordinate conversion
         # This maps from VISIBLE region to display pixels
@@ -163,68 +522,73 @@ class VideoCanvas(QLabel):
         self.offset_x = (widget_size.width() - scaled_pixmap.width()) // 2
         self.offset_y = (widget_size.height() - scaled_pixmap.height()) // 2
         
-        # Create painter for overlays
-        painter = QPainter(scaled_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw detected people (adjusted for zoom)
-        if self.detection_mode and self.detected_bboxes_display:
-            for i, (bx, by, bw, bh) in enumerate(self.detected_bboxes_display):
-                # Skip if outside visible region
-                if bx + bw < vx or bx > vx + vw or by + bh < vy or by > vy + vh:
-                    continue
-                
-                conf = self.detected_people[i][4] if i < len(self.detected_people) else 0.0
-                
-                pen = QPen(QColor(0, 255, 0))
-                pen.setWidth(3)
-                painter.setPen(pen)
-                
-                # Convert to display coordinates
-                sx, sy, sw, sh = self._frame_to_display_coords(bx, by, bw, bh)
-                painter.drawRect(int(sx), int(sy), int(sw), int(sh))
-                
-                # Draw label
-                conf_text = f"Person {i+1} ({conf:.0%})"
-                painter.setPen(QPen(QColor(0, 255, 0)))
-                text_rect = painter.fontMetrics().boundingRect(conf_text)
-                text_x = int(sx + (sw - text_rect.width()) // 2)
-                text_y = int(sy - 10) if sy > 30 else int(sy + sh + 20)
-                
-                bg_rect = QRect(text_x - 2, text_y - text_rect.height() - 2,
-                               text_rect.width() + 4, text_rect.height() + 4)
-                painter.fillRect(bg_rect, QColor(0, 0, 0, 180))
-                painter.drawText(text_x, text_y - 2, conf_text)
-        
-        # Draw existing bboxes
-        for bbox_data in self.displayed_bboxes:
-            x, y, w, h, name, style, color = bbox_data
-            self._draw_bbox_on_pixmap(painter, x, y, w, h, name, style, color)
-        
-        # Draw current bbox being drawn
-        if self.current_bbox:
-            x, y, w, h = self.current_bbox
-            self._draw_bbox_on_pixmap(painter, x, y, w, h, "", "rectangle", (255, 255, 255))
-        
-        # Draw zoom indicator
-        if self.show_zoom_indicator and self.zoom_level > 1.0:
-            self._draw_zoom_indicator(painter, scaled_pixmap.width(), scaled_pixmap.height())
-
-        # Draw radar preview if in radar edit mode
-        if self.radar_edit_mode and self.radar_player_bbox and self.radar_mouse_pos:
-            self._draw_radar_preview(painter)
-
-        painter.end()
+        self._base_scaled_pixmap = scaled_pixmap
+        self._base_region = visible_region
+        self._base_crop = (x1, y1, x2, y2)
+        self._base_frame_size = (frame_w, frame_h)
+        self._base_interpolation = interpolation
+        self._invalidate_scaled_cache()
+        self._base_smooth = smooth
+        self._frame_dirty = False
+        self._size_dirty = False
+        return True
+    
+    def _can_convert_in_background(self, visible_region: Tuple[float, float, float, float],
+                                   smooth: bool) -> bool:
+        """True if only the frame pixels changed since the base was built"""
+        return (self._frame_dirty and not self._size_dirty and smooth and self._base_smooth and
+                self._converter_thread.isRunning() and
+                self._base_scaled_pixmap is not None and visible_region == self._base_region and
+                (self._frame_w, self._frame_h) == self._base_frame_size)
+    
+    def _convert_in_background(self):
+        """Scale the current frame into the existing base geometry on a worker thread"""
+        frame = self.current_frame
+        if frame is self._converter_frame:
+            return  # Already on its way
+        
+        size = self._base_scaled_pixmap.size()
+        job = (frame, self._base_crop, (size.width(), size.height()),
+               self._base_interpolation, self._base_region)
+        self._converter_frame = frame
+        
+        if self._converter_busy:
+            self._queued_conversion = job  # Replaces any older waiting frame
+        else:
+            self._post_conversion(job)
+    
+    def _post_conversion(self, job: tuple):
+        """Queue one conversion to the worker thread"""
+        self._converter_busy = True
+        self._conversion_requested.emit(*job)
+    
+    def _on_frame_converted(self, frame: np.ndarray, visible_region: Tuple[float, float, float, float],
+                            image: QImage):
+        """Adopt a background-scaled frame as the new base and repaint"""
+        # Hand the worker the newest waiting frame, if any
+        self._converter_busy = False
+        job, self._queued_conversion = self._queued_conversion, None
+        if job is not None:
+            self._post_conversion(job)
+        
+        if frame is self._converter_frame:
+            self._converter_frame = None
+        
+        # Drop results superseded by a newer frame or a synchronous rebuild
+        if (frame is not self.current_frame or not self._frame_dirty or self._size_dirty or
+                visible_region != self._base_region or image.size() != self._base_scaled_pixmap.size()):
+            return
         
-        self.setPixmap(scaled_pixmap)
-        self.update()
+        self._base_scaled_pixmap = QPixmap.fromImage(image)
+        self._frame_dirty = False
+        self._update_display()
     
     def _get_visible_region(self) -> Tuple[float, float, float, float]:
         """Get the visible region in original frame coordinates"""
         if self.current_frame is None:
             return (0, 0, 100, 100)
         
-        frame_h, frame_w = self.current_frame.shape[:2]
+        frame_h, frame_w = self._frame_h, self._frame_w
         
         # Calculate visible size based on zoom
         visible_w = frame_w / self.zoom_level
@@ -240,37 +604,56 @@ class VideoCanvas(QLabel):
         
         return (vx, vy, visible_w, visible_h)
     
-    def _frame_to_display_coords(self, x: float, y: float, w: float = 0, h: float = 0) -> Tuple[float, float, float, float]:
-        """Convert original frame coordinates to display coordinates"""
-        vx, vy, vw, vh = self._visible_region if hasattr(self, '_visible_region') else (0, 0, 1, 1)
-        
-        # Offset by visible region
-        dx = (x - vx) * self.scale_factor
-        dy = (y - vy) * self.scale_factor
-        dw = w * self.scale_factor
-        dh = h * self.scale_factor
-        
-        return (dx, dy, dw, dh)
+    def _boxes_to_display(self, boxes) -> np.ndarray:
+        """Convert (x, y, w, h) frame boxes to an int32 array of display coordinates"""
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        vx, vy = self._visible_region[:2]
+        scaled = (boxes - (vx, vy, 0, 0)) * self.scale_factor
+        return scaled.astype(np.int32)
+    
+    def _bbox_dirty_rect(self, bbox) -> QRect:
+        """Canvas rect covering a plain bbox outline, including its pen width"""
+        sx, sy, sw, sh = self._boxes_to_display([bbox])[0].tolist()
+        return QRect(sx, sy, sw, sh).adjusted(-3, -3, 3, 3)
+    
+    @staticmethod
+    def _hoop_rects(scaled: np.ndarray) -> np.ndarray:
+        """Ellipse (left, top, width, height) for the 'circle' style of each display box"""
+        sx, sy, sw, sh = scaled.T
+        # Wide, flat floor hoop (3D perspective) centred on the player's torso
+        # so the back of the hoop is hidden behind the player
+        center_x = sx + sw // 2
+        center_y = sy + (sh * 0.5).astype(np.int32)
+        radius_x = np.maximum((sw * 1.2).astype(np.int32), 40)
+        radius_y = np.maximum((sw * 0.35).astype(np.int32), 18)
+        return np.stack([center_x - radius_x, center_y - radius_y,
+                         radius_x * 2, radius_y * 2], axis=1)
+    
+    def _invalidate_scaled_cache(self):
+        """Drop cached display coordinates after the boxes, scale or view change"""
+        self._scaled_displayed = None
+        self._scaled_detected = None
     
-    def _draw_zoom_indicator(self, painter: QPainter, width: int, height: int):
+    def _draw_zoom_indicator(self, painter: QPainter, width: int, height: int,
+                             visible_region: Tuple[float, float, float, float]):
         """Draw zoom level indicator and minimap"""
         # Zoom percentage text
         zoom_text = f"🔍 {self.zoom_level:.0%}"
-        font = QFont("Arial", 12, QFont.Weight.Bold)
-        painter.setFont(font)
+        painter.setFont(self._zoom_font)
         
-        text_rect = painter.fontMetrics().boundingRect(zoom_text)
+        text_w = self._zoom_font_metrics.horizontalAdvance(zoom_text)
+        text_h = self._zoom_font_metrics.height()
         margin = 10
         
         # Background
-        bg_rect = QRect(margin - 4, margin - 2, text_rect.width() + 12, text_rect.height() + 8)
-        painter.fillRect(bg_rect, QColor(0, 0, 0, 180))
-        painter.setPen(QPen(QColor(100, 200, 255)))
+        bg_rect = QRect(margin - 4, margin - 2, text_w + 12, text_h + 8)
+        painter.fillRect(bg_rect, self._text_bg_color)
+        painter.setPen(self._zoom_border_pen)
         painter.drawRect(bg_rect)
         
         # Text
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.drawText(margin, margin + text_rect.height(), zoom_text)
+        painter.setPen(self._white_pen)
+        painter.drawText(margin, margin + text_h, zoom_text)
         
         # Draw minimap in bottom-right corner
         if self.current_frame is not None:
@@ -280,64 +663,81 @@ class VideoCanvas(QLabel):
             mm_y = height - mm_size - mm_margin
             
             # Minimap background
-            painter.fillRect(mm_x - 2, mm_y - 2, mm_size + 4, mm_size + 4, QColor(0, 0, 0, 150))
+            painter.fillRect(mm_x - 2, mm_y - 2, mm_size + 4, mm_size + 4, self._minimap_bg_color)
             
             # Create tiny thumbnail
-            frame_h, frame_w = self.current_frame.shape[:2]
+            frame_h, frame_w = self._frame_h, self._frame_w
             aspect = frame_w / frame_h
             if aspect > 1:
                 mm_w, mm_h = mm_size, int(mm_size / aspect)
             else:
                 mm_w, mm_h = int(mm_size * aspect), mm_size
             
+            painter.drawPixmap(mm_x, mm_y, self._minimap_thumbnail(mm_w, mm_h))
+            
             # Draw visible region rectangle
-            vx, vy, vw, vh = self._get_visible_region()
+            vx, vy, vw, vh = visible_region
             rx = int(mm_x + (vx / frame_w) * mm_w)
             ry = int(mm_y + (vy / frame_h) * mm_h)
             rw = max(4, int((vw / frame_w) * mm_w))
             rh = max(4, int((vh / frame_h) * mm_h))
             
             # Outer frame
-            painter.setPen(QPen(QColor(100, 100, 100)))
+            painter.setPen(self._minimap_frame_pen)
             painter.drawRect(mm_x, mm_y, mm_w, mm_h)
             
             # Visible region
-            painter.setPen(QPen(QColor(255, 200, 0), 2))
+            painter.setPen(self._minimap_view_pen)
             painter.drawRect(rx, ry, rw, rh)
     
-    def _draw_bbox_on_pixmap(self, painter: QPainter, x: int, y: int, 
-                             w: int, h: int, name: str, style: str, color: Tuple[int, int, int]):
-        """Draw bounding box on pixmap (zoom-aware)"""
+    def _minimap_thumbnail(self, mm_w: int, mm_h: int) -> QPixmap:
+        """Get the minimap thumbnail of the current frame (cached per frame)"""
+        pixmap = self._minimap_pixmap
+        if pixmap is None or pixmap.width() != mm_w or pixmap.height() != mm_h:
+            thumb = cv2.resize(self.current_frame, (mm_w, mm_h), interpolation=cv2.INTER_AREA)
+            pixmap = QPixmap.fromImage(_bgr_to_qimage(thumb))
+            self._minimap_pixmap = pixmap
+        return pixmap
+    
+    def _pen(self, rgb: Tuple[int, int, int], width: int) -> QPen:
+        """Get a shared solid pen for an RGB color and width"""
+        key = (tuple(rgb), width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = QPen(QColor(*rgb))
+            pen.setWidth(width)
+            self._pen_cache[key] = pen
+        return pen
+    
+    def _text_width(self, text: str) -> int:
+        """Horizontal advance of a label in the widget font (memoized)"""
+        width = self._text_width_cache.get(text)
+        if width is None:
+            width = self._font_metrics.horizontalAdvance(text)
+            self._text_width_cache[text] = width
+        return width
+    
+    def _draw_bbox_on_pixmap(self, painter: QPainter, sx: int, sy: int, 
+                             sw: int, sh: int, name: str, style: str, color: Tuple[int, int, int],
+                             ellipse_rect: Optional[List[int]] = None):
+        """Draw bounding box on pixmap (sx, sy, sw, sh are display coordinates)
+        
+        A style of None draws only the name label.
+        """
         if self.scale_factor <= 0:
             return
         
-        # Convert frame coordinates to display coordinates (zoom-aware)
-        sx, sy, sw, sh = self._frame_to_display_coords(x, y, w, h)
-        sx, sy, sw, sh = int(sx), int(sy), int(sw), int(sh)
-        
-        # Set pen color
-        pen = QPen(QColor(*color))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        # Set pen color (label-only calls draw no outline)
+        if style is not None:
+            painter.setPen(self._pen(color, 2))
         
         if style == 'rectangle':
             painter.drawRect(sx, sy, sw, sh)
         elif style == 'circle':
-            # Draw 3D floor hoop - ellipse with player in center
-            center_x = sx + sw // 2
-            
-            # Calculate ellipse radii (matching reference image)
-            radius_x = max(int(sw * 1.2), 40)  # Larger horizontal radius for 3D effect
-            radius_y = max(int(sw * 0.35), 18)  # Vertical radius (compressed for perspective)
-            
-            # Center Y: Place at player's CENTER (torso area) for 3D effect
-            # This makes the player appear IN THE MIDDLE of the floor hoop
-            # Back part of hoop will be hidden behind player (3D layering)
-            center_y = sy + int(sh * 0.5)  # Center of player body
-            
-            # Draw ellipse: QRect(left, top, width, height)
-            # left = center_x - radius_x, top = center_y - radius_y
-            painter.drawEllipse(center_x - radius_x, center_y - radius_y, radius_x * 2, radius_y * 2)
+            # Draw 3D floor hoop - ellipse with player in center (see _hoop_rects)
+            if ellipse_rect is None:
+                ellipse_rect = self._hoop_rects(np.array([[sx, sy, sw, sh]], dtype=np.int32))[0].tolist()
+            painter.drawEllipse(*ellipse_rect)
         elif style == 'arrow':
             # Draw arrow above
             arrow_y = max(0, sy - 30)
@@ -351,18 +751,16 @@ class VideoCanvas(QLabel):
         
         # Draw name if provided - position it above the bbox, centered
         if name:
-            painter.setPen(QPen(QColor(255, 255, 255)))
-            painter.setFont(painter.font())
-            # Get text metrics
-            text_rect = painter.fontMetrics().boundingRect(name)
+            painter.setPen(self._white_pen)
+            # Get text metrics (width only needs the advance, height is per-font)
+            text_w = self._text_width(name)
+            text_h = self._text_height
             # Center the text horizontally over the bbox
-            text_x = sx + (sw - text_rect.width()) // 2
+            text_x = sx + (sw - text_w) // 2
             text_y = sy - 10  # Position above the bbox
             # Draw background rectangle for text readability
-            from PyQt6.QtCore import QRect
-            bg_rect = QRect(text_x - 4, text_y - text_rect.height() - 2, 
-                           text_rect.width() + 8, text_rect.height() + 4)
-            painter.fillRect(bg_rect, QColor(0, 0, 0, 180))
+            painter.fillRect(text_x - 4, text_y - text_h - 2, text_w + 8, text_h + 4,
+                             self._text_bg_color)
             painter.drawText(text_x, text_y - 2, name)
     
     def add_bbox(self, x: int, y: int, w: int, h: int, 
@@ -378,26 +776,43 @@ class VideoCanvas(QLabel):
             color: RGB color tuple
         """
         self.displayed_bboxes.append((x, y, w, h, name, style, color))
-        self._update_display()
+        self._scaled_displayed = None
+        self._refresh_bboxes()
     
     def clear_bboxes(self):
         """Clear all displayed bounding boxes"""
         self.displayed_bboxes.clear()
         self.current_bbox = None
-        self._update_display()
+        self._scaled_displayed = None
+        self._refresh_bboxes()
     
     def remove_bbox(self, index: int):
         """Remove a bounding box by index"""
         if 0 <= index < len(self.displayed_bboxes):
             self.displayed_bboxes.pop(index)
-            self._update_display()
+            self._scaled_displayed = None
+            self._refresh_bboxes()
+    
+    def _refresh_bboxes(self):
+        """Repaint after a bbox list change - skipped while hidden or inside a batch"""
+        if self.isVisible() and self.updatesEnabled():
+            self._request_update()
+    
+    def begin_batch(self):
+        """Suspend repaints while adding/removing many bboxes"""
+        self.setUpdatesEnabled(False)
+    
+    def end_batch(self):
+        """Resume repaints after begin_batch() and redraw once (deferred while hidden)"""
+        self.setUpdatesEnabled(True)
+        self._refresh_bboxes()
     
     def _get_image_coords_from_mouse(self, mouse_x: float, mouse_y: float) -> tuple:
         """Convert mouse coordinates to original image coordinates (zoom-aware)"""
         if self.current_frame is None or self.scale_factor <= 0:
             return None, None
         
-        pixmap = self.pixmap()
+        pixmap = self._base_scaled_pixmap
         if pixmap is None:
             return None, None
         
@@ -409,15 +824,16 @@ class VideoCanvas(QLabel):
         if rel_x < 0 or rel_y < 0 or rel_x > pixmap.width() or rel_y > pixmap.height():
             return None, None
         
-        # Convert to visible region coordinates
-        vx, vy, vw, vh = self._get_visible_region()
+        # Convert using the region the displayed pixmap was built from, which
+        # also keeps clicks consistent while a repaint is still pending
+        vx, vy = self._visible_region[:2]
         
         # Map from display to original frame coordinates
         x = int(vx + (rel_x / self.scale_factor))
         y = int(vy + (rel_y / self.scale_factor))
         
         # Clamp to frame bounds
-        h, w = self.current_frame.shape[:2]
+        h, w = self._frame_h, self._frame_w
         x = max(0, min(x, w - 1))
         y = max(0, min(y, h - 1))
         
@@ -434,52 +850,57 @@ class VideoCanvas(QLabel):
                         modifiers & Qt.KeyboardModifier.MetaModifier)
 
         if zoom_modifier and self.current_frame is not None:
-            # Get mouse position for zoom centering
-            mouse_pos = event.position()
-            
-            # Calculate zoom direction
-            delta = event.angleDelta().y()
-            
-            if delta > 0:
-                # Zoom in
-                new_zoom = min(self.max_zoom, self.zoom_level * (1 + self.zoom_step))
-            else:
-                # Zoom out
-                new_zoom = max(self.min_zoom, self.zoom_level / (1 + self.zoom_step))
-            
-            if new_zoom != self.zoom_level:
-                # Get image coords under mouse before zoom
-                img_x, img_y = self._get_image_coords_from_mouse(mouse_pos.x(), mouse_pos.y())
-                
-                if img_x is not None:
-                    # Update zoom
-                    self.zoom_level = new_zoom
-                    
-                    # Adjust pan to keep mouse position stable
-                    self.pan_x = img_x
-                    self.pan_y = img_y
-                    
-                    self._clamp_pan()
-                    self._update_display()
-                    
-                    # Emit signal for detection trigger
-                    self.zoom_changed.emit(self.zoom_level, self._get_visible_region())
-                    
-                    # Request detection on zoomed area if zoomed in significantly
-                    if self.zoom_level >= 1.5:
-                        self._request_zoom_detection()
+            # Accumulate ticks and zoom once per ~16 ms - trackpads deliver
+            # many small deltas per second
+            self._wheel_delta += event.angleDelta().y()
+            self._wheel_pos = event.position()
+            if not self._wheel_timer.isActive():
+                self._wheel_timer.start()
             
             event.accept()
         else:
             # Pass to parent for normal scrolling
             super().wheelEvent(event)
     
+    def _apply_wheel_zoom(self):
+        """Apply the wheel delta accumulated by wheelEvent in one zoom step"""
+        delta, self._wheel_delta = self._wheel_delta, 0
+        if delta == 0 or self.current_frame is None:
+            return
+        
+        # One zoom_step per 120-unit wheel notch, proportional for finer deltas
+        factor = (1 + self.zoom_step) ** (delta / 120)
+        new_zoom = max(self.min_zoom, min(self.max_zoom, self.zoom_level * factor))
+        
+        if new_zoom != self.zoom_level:
+            # Get image coords under mouse before zoom
+            mouse_pos = self._wheel_pos
+            img_x, img_y = self._get_image_coords_from_mouse(mouse_pos.x(), mouse_pos.y())
+            
+            if img_x is not None:
+                # Update zoom
+                self.zoom_level = new_zoom
+                
+                # Adjust pan to keep mouse position stable
+                self.pan_x = img_x
+                self.pan_y = img_y
+                
+                self._clamp_pan()
+                self._update_display()
+                
+                # Emit signal for detection trigger
+                self.zoom_changed.emit(self.zoom_level, self._get_visible_region())
+                
+                # Request detection on zoomed area if zoomed in significantly
+                if self.zoom_level >= 1.5:
+                    self._request_zoom_detection()
+    
     def _clamp_pan(self):
         """Clamp pan position to keep view within frame bounds"""
         if self.current_frame is None:
             return
         
-        frame_h, frame_w = self.current_frame.shape[:2]
+        frame_h, frame_w = self._frame_h, self._frame_w
         visible_w = frame_w / self.zoom_level
         visible_h = frame_h / self.zoom_level
         
@@ -498,13 +919,14 @@ class VideoCanvas(QLabel):
             return
         
         vx, vy, vw, vh = self._get_visible_region()
-        frame_h, frame_w = self.current_frame.shape[:2]
+        frame_h, frame_w = self._frame_h, self._frame_w
         
         # Crop the visible region
         x1, y1 = int(max(0, vx)), int(max(0, vy))
         x2, y2 = int(min(frame_w, vx + vw)), int(min(frame_h, vy + vh))
         
-        cropped = self.current_frame[y1:y2, x1:x2].copy()
+        # A view into current_frame - receivers must copy before modifying
+        cropped = self.current_frame[y1:y2, x1:x2]
         
         # Emit signal with cropped frame and original region
         self.zoom_detection_requested.emit(cropped, (x1, y1, x2 - x1, y2 - y1))
@@ -513,7 +935,7 @@ class VideoCanvas(QLabel):
         """Reset zoom to 100% and center view"""
         self.zoom_level = 1.0
         if self.current_frame is not None:
-            h, w = self.current_frame.shape[:2]
+            h, w = self._frame_h, self._frame_w
             self.pan_x = w / 2
             self.pan_y = h / 2
         self._update_display()
@@ -536,7 +958,7 @@ class VideoCanvas(QLabel):
         if self.current_frame is None:
             return
         
-        frame_h, frame_w = self.current_frame.shape[:2]
+        frame_h, frame_w = self._frame_h, self._frame_w
         
         # Calculate zoom level to fit bbox with padding
         zoom_w = frame_w / (w * padding)
@@ -553,17 +975,21 @@ class VideoCanvas(QLabel):
         self.zoom_changed.emit(self.zoom_level, self._get_visible_region())
     
     def get_visible_frame_crop(self) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
-        """Get the currently visible cropped frame and its original coordinates"""
+        """Get the currently visible cropped frame and its original coordinates
+        
+        The crop is a view into the current frame; copy it before modifying
+        it or keeping it beyond the next set_frame().
+        """
         if self.current_frame is None:
             return None, (0, 0, 0, 0)
         
         vx, vy, vw, vh = self._get_visible_region()
-        frame_h, frame_w = self.current_frame.shape[:2]
+        frame_h, frame_w = self._frame_h, self._frame_w
         
         x1, y1 = int(max(0, vx)), int(max(0, vy))
         x2, y2 = int(min(frame_w, vx + vw)), int(min(frame_h, vy + vh))
         
-        cropped = self.current_frame[y1:y2, x1:x2].copy()
+        cropped = self.current_frame[y1:y2, x1:x2]
         return cropped, (x1, y1, x2 - x1, y2 - y1)
     
     def mousePressEvent(self, event):
@@ -573,18 +999,17 @@ class VideoCanvas(QLabel):
             mouse_y = event.position().y()
 
             # Handle radar edit mode - click to confirm direction
+            # Flush a pending preview so the angle matches the last mouse position
+            if self.radar_edit_mode:
+                self._flush_pending_update()
             if self.radar_edit_mode and self.radar_preview_angle is not None:
                 angle = self.radar_preview_angle
                 self.radar_direction_set.emit(angle)
                 self.exit_radar_edit_mode()
                 return
 
-            # Check for pan mode: Middle button OR Shift+Left OR zoomed in + Alt+Left
-            modifiers = event.modifiers()
-            is_pan_mode = (modifiers & Qt.KeyboardModifier.ShiftModifier or
-                          (self.zoom_level > 1.0 and modifiers & Qt.KeyboardModifier.AltModifier))
-
-            if is_pan_mode and self.zoom_level > 1.0:
+            # Check for pan mode: Shift+Left or Alt+Left while zoomed in
+            if self.zoom_level > 1.0 and self._is_pan_modifier(event.modifiers()):
                 # Start panning
                 self.panning = True
                 self.pan_start_pos = QPoint(int(mouse_x), int(mouse_y))
@@ -595,7 +1020,7 @@ class VideoCanvas(QLabel):
             x, y = self._get_image_coords_from_mouse(mouse_x, mouse_y)
             if x is not None and y is not None:
                 # If in detection mode, check if clicking on a detected person
-                if self.detection_mode and self.detected_bboxes_display:
+                if self.detection_mode and len(self.detected_bboxes_display):
                     clicked_bbox = self._find_clicked_bbox(x, y)
                     if clicked_bbox:
                         self.person_clicked.emit(*clicked_bbox)
@@ -615,38 +1040,56 @@ class VideoCanvas(QLabel):
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
     
     def _find_clicked_bbox(self, x: int, y: int) -> Optional[Tuple[int, int, int, int]]:
-        """Find which detected bbox was clicked"""
-        for bbox in self.detected_bboxes_display:
-            bx, by, bw, bh = bbox
-            if bx <= x <= bx + bw and by <= y <= by + bh:
-                return bbox
-        return None
+        """Find which detected bbox was clicked (first match wins)"""
+        boxes = self.detected_bboxes_display
+        mask = ((boxes[:, 0] <= x) & (x <= boxes[:, 0] + boxes[:, 2]) &
+                (boxes[:, 1] <= y) & (y <= boxes[:, 1] + boxes[:, 3]))
+        if not mask.any():
+            return None
+        return tuple(boxes[np.argmax(mask)].tolist())
     
     def set_detected_people(self, detections: List[Tuple[int, int, int, int, float]]):
         """Set detected people to display"""
         self.detected_people = detections
-        self.detected_bboxes_display = [(x, y, w, h) for x, y, w, h, conf in detections]
-        self._update_display()
+        arr = np.asarray(detections, dtype=np.float64).reshape(-1, 5)
+        self.detected_bboxes_display = arr[:, :4].astype(np.int32)
+        self._detected_conf = arr[:, 4]
+        self._scaled_detected = None
+        self._request_update()
     
     def enable_detection_mode(self, enable: bool = True):
         """Enable or disable detection mode"""
         self.detection_mode = enable
         if not enable:
             self.detected_people = []
-            self.detected_bboxes_display = []
-        self._update_display()
+            self.detected_bboxes_display = np.empty((0, 4), dtype=np.int32)
+            self._detected_conf = np.empty(0)
+            self._scaled_detected = None
+        self._request_update()
+    
+    @staticmethod
+    def _is_pan_modifier(modifiers) -> bool:
+        """True if Shift or Alt is held (drag pans the zoomed view)"""
+        return bool(modifiers & (Qt.KeyboardModifier.ShiftModifier | Qt.KeyboardModifier.AltModifier))
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for drawing bounding box or panning"""
         mouse_x = event.position().x()
         mouse_y = event.position().y()
+        
+        # High-resolution pointers report sub-pixel moves; nothing visible changes
+        last = self._last_mouse_pos
+        if last is not None and abs(mouse_x - last[0]) + abs(mouse_y - last[1]) < 1.0:
+            return
+        self._last_mouse_pos = (mouse_x, mouse_y)
 
         # Handle radar edit mode - update preview on mouse move
         if self.radar_edit_mode and self.current_frame is not None:
             x, y = self._get_image_coords_from_mouse(mouse_x, mouse_y)
-            if x is not None and y is not None:
+            if x is not None and y is not None and (x, y) != self.radar_mouse_pos:
                 self.radar_mouse_pos = (x, y)
-                self._update_display()
+                # Repaint where the old cone was; _update_display adds the new one
+                self._request_repaint(self._radar_drawn_rect)
             return
 
         # Handle panning
@@ -664,7 +1107,7 @@ class VideoCanvas(QLabel):
             self.pan_y = self.pan_start_offset[1] - frame_dy
             
             self._clamp_pan()
-            self._update_display()
+            self._request_repaint()
             return
         
         # Handle bbox drawing
@@ -681,14 +1124,18 @@ class VideoCanvas(QLabel):
                 w = x2 - x1
                 h = y2 - y1
                 
-                if w > 10 and h > 10:
+                if w > 10 and h > 10 and (x1, y1, w, h) != self.current_bbox:
+                    # Only the old and new rubber band areas need repainting
+                    dirty = self._bbox_dirty_rect((x1, y1, w, h))
+                    if self.current_bbox:
+                        dirty = dirty.united(self._bbox_dirty_rect(self.current_bbox))
                     self.current_bbox = (x1, y1, w, h)
-                    self._update_display()
+                    self._request_repaint(dirty)
         
         # Update cursor when zoomed
         if self.zoom_level > 1.0 and not self.panning and not self.drawing:
-            modifiers = QApplication.keyboardModifiers()
-            if modifiers & Qt.KeyboardModifier.ShiftModifier or modifiers & Qt.KeyboardModifier.AltModifier:
+            # The event carries the modifier state - no global keyboard query needed
+            if self._is_pan_modifier(event.modifiers()):
                 self.setCursor(Qt.CursorShape.OpenHandCursor)
             else:
                 self.setCursor(Qt.CursorShape.ArrowCursor)
@@ -699,6 +1146,8 @@ class VideoCanvas(QLabel):
         if self.panning:
             self.panning = False
             self.setCursor(Qt.CursorShape.ArrowCursor)
+            # Replace the fast-scaled pan preview with a smooth one
+            QTimer.singleShot(0, self._update_display)
             return
 
         if event.button() == Qt.MouseButton.LeftButton and self.drawing:
@@ -742,18 +1191,11 @@ class VideoCanvas(QLabel):
         key = event.key()
         modifiers = event.modifiers()
         
-        # Cmd/Ctrl + Plus: Zoom In
-        if (modifiers & Qt.KeyboardModifier.ControlModifier or modifiers & Qt.KeyboardModifier.MetaModifier):
-            if key == Qt.Key.Key_Plus or key == Qt.Key.Key_Equal:
-                self.set_zoom(self.zoom_level * 1.25, self.pan_x, self.pan_y)
-                event.accept()
-                return
-            elif key == Qt.Key.Key_Minus:
-                self.set_zoom(self.zoom_level / 1.25, self.pan_x, self.pan_y)
-                event.accept()
-                return
-            elif key == Qt.Key.Key_0:
-                self.reset_zoom()
+        # Cmd/Ctrl + Plus/Minus/0: Zoom in/out/reset
+        if modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.MetaModifier):
+            action = self._zoom_key_actions.get(key)
+            if action is not None:
+                action()
                 event.accept()
                 return
         
@@ -773,8 +1215,38 @@ class VideoCanvas(QLabel):
     def resizeEvent(self, event):
         """Handle widget resize"""
         super().resizeEvent(event)
+        self._size_dirty = True
         self._clamp_pan()  # Ensure pan stays valid after resize
-        self._update_display()
+        self._request_update()
+    
+    def showEvent(self, event):
+        """Bring the display up to date with bbox changes made while hidden"""
+        super().showEvent(event)
+        if not self._converter_thread.isRunning():  # Stopped by closeEvent
+            self._converter_busy = False
+            self._converter_thread.start()
+        self._request_update()
+    
+    def hideEvent(self, event):
+        """Drop a waiting frame conversion; the display is rebuilt on show"""
+        super().hideEvent(event)
+        self._queued_conversion = None
+        self._converter_frame = None
+    
+    def closeEvent(self, event):
+        """Stop the frame-conversion thread"""
+        super().closeEvent(event)
+        _stop_thread(self._converter_thread)
+    
+    def changeEvent(self, event):
+        """Keep cached label metrics in sync with the widget font"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._font_metrics = QFontMetrics(self.font())
+            self._text_height = self._font_metrics.height()
+            self._text_width_cache.clear()
+            self._radar_banner_pixmap = None
+            self._request_update()
     
     def focusInEvent(self, event):
         """Ensure widget accepts focus for keyboard events"""
@@ -790,15 +1262,15 @@ class VideoCanvas(QLabel):
         Args:
             player_bbox: (x, y, w, h) of the player's bounding box
         """
-        print(f"VideoCanvas.enter_radar_edit_mode called with bbox: {player_bbox}")
+        logger.debug("enter_radar_edit_mode bbox=%s", player_bbox)
         self.radar_edit_mode = True
         self.radar_player_bbox = player_bbox
         self.radar_preview_angle = None
         self.radar_mouse_pos = None
+        self._radar_drawn_rect = None
         self.radar_preview_size = 1.0  # Reset size
         self.setCursor(Qt.CursorShape.CrossCursor)
-        self._update_display()
-        print(f"  radar_edit_mode is now: {self.radar_edit_mode}")
+        self._request_update()
 
     def exit_radar_edit_mode(self):
         """Exit radar direction editing mode"""
@@ -806,22 +1278,51 @@ class VideoCanvas(QLabel):
         self.radar_player_bbox = None
         self.radar_preview_angle = None
         self.radar_mouse_pos = None
+        self._radar_drawn_rect = None
         self.radar_preview_size = 1.0
         self.setCursor(Qt.CursorShape.ArrowCursor)
-        self._update_display()
+        self._radar_banner_pixmap = None
+        self._request_update()
 
     def update_radar_bbox(self, player_bbox: Tuple[int, int, int, int]):
         """Update the radar bbox (called when player moves)"""
         if self.radar_edit_mode:
             self.radar_player_bbox = player_bbox
-            self._update_display()
+            self._request_update()
 
-    def _draw_radar_preview(self, painter: QPainter):
-        """Draw radar cone preview - distance to mouse = radar size, direction = radar angle"""
-        import math
+    def _build_radar_grid_path(self, origin_dx: float, origin_dy: float, cone_length: int,
+                               left_angle: float, right_angle: float,
+                               radial_ends: List[List[int]]) -> QPainterPath:
+        """Path with the radar cone's distance arcs and radial lines (display coordinates)"""
+        path = QPainterPath()
 
-        if not self.radar_player_bbox or not self.radar_mouse_pos:
-            return
+        # Distance arcs
+        start_angle_deg = int(math.degrees(-right_angle))
+        span_angle_deg = int(math.degrees(right_angle - left_angle))
+        arc_radii_frame = (cone_length * _RADAR_ARC_FRACTIONS).astype(np.int64)
+        arc_radii = (arc_radii_frame * self.scale_factor).astype(np.int64)
+        for arc_radius in arc_radii.tolist():
+            arc_rect = QRectF(int(origin_dx - arc_radius), int(origin_dy - arc_radius),
+                              arc_radius * 2, arc_radius * 2)
+            path.arcMoveTo(arc_rect, start_angle_deg)
+            path.arcTo(arc_rect, start_angle_deg, span_angle_deg)
+
+        # Radial lines
+        for end_dx, end_dy in radial_ends:
+            path.moveTo(int(origin_dx), int(origin_dy))
+            path.lineTo(end_dx, end_dy)
+
+        return path
+
+    def _radar_geometry(self):
+        """Display-space radar preview geometry, cached while the cone is unchanged
+        
+        Returns (angle, size, polygon, grid_path, origin, mouse, bounds) where
+        bounds is the canvas rect the preview paints into.
+        """
+        key = (self.radar_player_bbox, self.radar_mouse_pos, self._visible_region, self.scale_factor)
+        if key == self._radar_geometry_key:
+            return self._radar_geometry_cache
 
         bx, by, bw, bh = self.radar_player_bbox
         mouse_x, mouse_y = self.radar_mouse_pos
@@ -836,14 +1337,12 @@ class VideoCanvas(QLabel):
         angle = math.atan2(dy, dx)
         distance = math.sqrt(dx * dx + dy * dy)
 
-        self.radar_preview_angle = angle
-
         # Cone length = distance to mouse position!
         cone_length = max(20, int(distance))  # Minimum 20 pixels
 
         # Calculate size multiplier relative to default size (for saving to keyframe)
         base_cone_length = max(1, int(bh * 1.2))
-        self.radar_preview_size = cone_length / base_cone_length
+        size = cone_length / base_cone_length
 
         cone_half_angle = 30  # degrees
 
@@ -851,20 +1350,49 @@ class VideoCanvas(QLabel):
         left_angle = angle - math.radians(cone_half_angle)
         right_angle = angle + math.radians(cone_half_angle)
 
-        # End points of cone (in frame coordinates) - ends at mouse distance
-        end_left_x = player_x + cone_length * math.cos(left_angle)
-        end_left_y = player_y + cone_length * math.sin(left_angle)
-        end_right_x = player_x + cone_length * math.cos(right_angle)
-        end_right_y = player_y + cone_length * math.sin(right_angle)
+        # Radial line end points (frame coordinates) - they end at mouse distance,
+        # the first and last one are the cone edges
+        radial_angles = left_angle + _RADAR_RADIAL_T * (right_angle - left_angle)
+        points = np.empty((len(radial_angles) + 2, 2))
+        points[0] = (player_x, player_y)
+        points[1:-1, 0] = player_x + cone_length * np.cos(radial_angles)
+        points[1:-1, 1] = player_y + cone_length * np.sin(radial_angles)
+        points[-1] = (mouse_x, mouse_y)
+
+        # Convert all points to display coordinates at once
+        points -= self._visible_region[:2]
+        points *= self.scale_factor
+        (origin_dx, origin_dy), mouse = points[0].tolist(), points[-1].tolist()
+        radial_ends = points[1:-1].astype(np.int64).tolist()
+        origin = (int(origin_dx), int(origin_dy))
+
+        polygon = QPolygon([QPoint(*origin), QPoint(*radial_ends[0]), QPoint(*radial_ends[-1])])
+        grid_path = self._build_radar_grid_path(origin_dx, origin_dy, cone_length,
+                                                left_angle, right_angle, radial_ends)
 
-        # Convert to display coordinates
-        origin_dx, origin_dy, _, _ = self._frame_to_display_coords(player_x, player_y, 0, 0)
-        left_dx, left_dy, _, _ = self._frame_to_display_coords(end_left_x, end_left_y, 0, 0)
-        right_dx, right_dy, _, _ = self._frame_to_display_coords(end_right_x, end_right_y, 0, 0)
-        mouse_dx, mouse_dy, _, _ = self._frame_to_display_coords(mouse_x, mouse_y, 0, 0)
+        # Everything drawn: cone, grid, origin glow (r=8) and crosshair (+-10),
+        # padded for pen width and antialiasing
+        bounds = grid_path.boundingRect().toAlignedRect()
+        bounds = bounds.united(polygon.boundingRect())
+        bounds = bounds.united(QRect(origin[0] - 8, origin[1] - 8, 17, 17))
+        bounds = bounds.united(QRect(int(mouse[0]) - 10, int(mouse[1]) - 10, 21, 21))
+        bounds = bounds.adjusted(-3, -3, 3, 3)
+
+        self._radar_geometry_key = key
+        self._radar_geometry_cache = (angle, size, polygon, grid_path, origin, mouse, bounds)
+        return self._radar_geometry_cache
+
+    def _draw_radar_preview(self, painter: QPainter):
+        """Draw radar cone preview - distance to mouse = radar size, direction = radar angle"""
+        if not self.radar_player_bbox or not self.radar_mouse_pos:
+            return
+
+        angle, size, polygon, grid_path, origin, (mouse_dx, mouse_dy), bounds = self._radar_geometry()
+        self.radar_preview_angle = angle
+        self.radar_preview_size = size
+        self._radar_drawn_rect = bounds
 
         # Radar colors - green style matching actual radar
-        from PyQt6.QtGui import QPolygon, QBrush
         radar_green = QColor(0, 255, 100)
         radar_green_dark = QColor(0, 180, 60)
         radar_green_trans = QColor(0, 255, 100, 50)
@@ -872,41 +1400,14 @@ class VideoCanvas(QLabel):
         # Draw semi-transparent cone fill
         painter.setBrush(QBrush(radar_green_trans))
         painter.setPen(Qt.PenStyle.NoPen)
-
-        polygon = QPolygon([
-            QPoint(int(origin_dx), int(origin_dy)),
-            QPoint(int(left_dx), int(left_dy)),
-            QPoint(int(right_dx), int(right_dy))
-        ])
         painter.drawPolygon(polygon)
 
-        # Draw arc lines
-        num_arcs = 4
+        # Draw arc and radial lines as one path
         pen = QPen(radar_green_dark)
         pen.setWidth(1)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-
-        for i in range(1, num_arcs + 1):
-            arc_radius_frame = int(cone_length * i / num_arcs)
-            arc_radius = int(arc_radius_frame * self.scale_factor)
-            start_angle_deg = int(math.degrees(-right_angle)) * 16
-            span_angle_deg = int(math.degrees(right_angle - left_angle)) * 16
-            painter.drawArc(
-                int(origin_dx - arc_radius), int(origin_dy - arc_radius),
-                arc_radius * 2, arc_radius * 2,
-                start_angle_deg, span_angle_deg
-            )
-
-        # Draw radial lines
-        num_radials = 5
-        for i in range(num_radials + 1):
-            t = i / num_radials
-            line_angle = left_angle + t * (right_angle - left_angle)
-            end_x = player_x + cone_length * math.cos(line_angle)
-            end_y = player_y + cone_length * math.sin(line_angle)
-            end_dx, end_dy, _, _ = self._frame_to_display_coords(end_x, end_y, 0, 0)
-            painter.drawLine(int(origin_dx), int(origin_dy), int(end_dx), int(end_dy))
+        painter.drawPath(grid_path)
 
         # Draw cone outline
         pen = QPen(radar_green)
@@ -915,12 +1416,10 @@ class VideoCanvas(QLabel):
         painter.drawPolygon(polygon)
 
         # Draw origin point with glow effect
-        painter.setBrush(QBrush(radar_green_dark))
-        painter.drawEllipse(QPoint(int(origin_dx), int(origin_dy)), 8, 8)
-        painter.setBrush(QBrush(radar_green))
-        painter.drawEllipse(QPoint(int(origin_dx), int(origin_dy)), 5, 5)
-        painter.setBrush(QBrush(QColor(255, 255, 255)))
-        painter.drawEllipse(QPoint(int(origin_dx), int(origin_dy)), 3, 3)
+        if self._radar_origin_pixmap is None:
+            self._radar_origin_pixmap = self._render_radar_origin(pen, radar_green, radar_green_dark)
+        painter.drawPixmap(origin[0] - _RADAR_ORIGIN_HALF, origin[1] - _RADAR_ORIGIN_HALF,
+                           self._radar_origin_pixmap)
 
         # Draw crosshair at mouse position (shows exactly where radar edge will be)
         pen.setStyle(Qt.PenStyle.SolidLine)
@@ -933,11 +1432,50 @@ class VideoCanvas(QLabel):
         painter.drawLine(int(mouse_dx), int(mouse_dy - crosshair_size),
                         int(mouse_dx), int(mouse_dy + crosshair_size))
 
-        # Draw instruction text
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        font = painter.font()
+        # Draw instruction text (baseline at y=25)
+        if self._radar_banner_pixmap is None:
+            self._radar_banner_pixmap, self._radar_banner_ascent = self._render_radar_banner()
+        painter.drawPixmap(10, 25 - self._radar_banner_ascent, self._radar_banner_pixmap)
+
+    def _render_radar_origin(self, pen: QPen, radar_green: QColor, radar_green_dark: QColor) -> QPixmap:
+        """Rasterize the origin marker (three outlined concentric dots) once"""
+        ratio = self.devicePixelRatioF()
+        size = 2 * _RADAR_ORIGIN_HALF
+        pixmap = QPixmap(int(size * ratio), int(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        center = QPoint(_RADAR_ORIGIN_HALF, _RADAR_ORIGIN_HALF)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(pen)
+        painter.setBrush(QBrush(radar_green_dark))
+        painter.drawEllipse(center, 8, 8)
+        painter.setBrush(QBrush(radar_green))
+        painter.drawEllipse(center, 5, 5)
+        painter.setBrush(QBrush(QColor(255, 255, 255)))
+        painter.drawEllipse(center, 3, 3)
+        painter.end()
+        return pixmap
+
+    def _render_radar_banner(self) -> Tuple[QPixmap, int]:
+        """Rasterize the radar instruction text once; returns (pixmap, ascent)"""
+        text = "📡 RADAR: Move to aim | Distance = Size | Click to confirm | ESC to cancel"
+        font = QFont(self.font())
         font.setPointSize(12)
         font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(10, 25, "📡 RADAR: Move to aim | Distance = Size | Click to confirm | ESC to cancel")
+        metrics = QFontMetrics(font)
 
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(metrics.horizontalAdvance(text) * ratio) + 1,
+                         int(metrics.height() * ratio) + 1)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setPen(self._white_pen)
+        painter.setFont(font)
+        painter.drawText(0, metrics.ascent(), text)
+        painter.end()
+        return pixmap, metrics.ascent()
@@ -15,6 +15,7 @@ This script tests:
 
 import sys
 import os
+import time
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,7 +27,7 @@ from src.ui.tracking_review_dialog_simple import TrackingReviewDialog
 from src.render.video_exporter import VideoExporter
 
 
-def test_complete_workflow(video_path: str):
+def test_complete_workflow(video_path: str, frame_stride: int = 1):
     """
     Test complete three-phase workflow
 
@@ -101,11 +102,29 @@ def test_complete_workflow(video_path: str):
     end_frame = min(200, tracker_manager.total_frames - 1)
     print(f"\nTracking frames 0 to {end_frame}...")
 
+    progress = {'time': 0.0, 'latest': None}
+
+    def show_progress(curr, total):
+        print(f"  Progress: {curr}/{total} frames ({100*curr//total}%)", end='\r', flush=True)
+
+    def print_progress(curr, total):
+        # Refresh at most 10 times a second - a terminal write per frame slows
+        # fast trackers. Not keyed on frame counts: with frame_stride > 1 only
+        # some values of curr are ever reported
+        progress['latest'] = (curr, total)
+        now = time.monotonic()
+        if now - progress['time'] >= 0.1:
+            progress['time'] = now
+            show_progress(curr, total)
+
     tracking_data = tracker_manager.generate_tracking_data(
         start_frame=0,
         end_frame=end_frame,
-        progress_callback=lambda curr, total: print(f"  Progress: {curr}/{total} frames ({100*curr//total}%)", end='\r')
+        progress_callback=print_progress,
+        frame_stride=frame_stride
     )
+    if progress['latest']:
+        show_progress(*progress['latest'])  # Final count
 
     print(f"\n✅ Tracking data generated!")
 
@@ -121,58 +140,56 @@ def test_complete_workflow(video_path: str):
         player = tracker_manager.get_player(pid)
         player_data = tracking_data[pid]
 
-        # Analyze issues
-        issues = analyzer.analyze(
+        # Analyze issues, summarize and score in a single pass
+        issues, summary, quality_score = analyzer.analyze_full(
             player_data,
             tracker_manager.frame_width,
             tracker_manager.frame_height
         )
 
-        # Get summary
-        summary = analyzer.get_summary(issues)
-
-        # Calculate quality score
-        quality_score = analyzer.calculate_tracking_quality_score(player_data, issues)
-
-        print(f"\n{player.name}:")
-        print(f"  📊 Quality Score: {quality_score:.2f} / 1.00")
-        print(f"  🔢 Total Issues: {summary['total']}")
+        # Collect the player's report and write it in one go
+        lines = []
+        lines.append(f"\n{player.name}:")
+        lines.append(f"  📊 Quality Score: {quality_score:.2f} / 1.00")
+        lines.append(f"  🔢 Total Issues: {summary['total']}")
 
         if summary['by_severity']:
-            print(f"  📈 By Severity:")
+            lines.append(f"  📈 By Severity:")
             for severity, count in summary['by_severity'].items():
                 emoji = "🔴" if severity == "critical" else "🟠" if severity == "high" else "🟡" if severity == "medium" else "🟢"
-                print(f"     {emoji} {severity}: {count}")
+                lines.append(f"     {emoji} {severity}: {count}")
 
         if summary['by_type']:
-            print(f"  🏷️  By Type:")
+            lines.append(f"  🏷️  By Type:")
             for issue_type, count in summary['by_type'].items():
-                print(f"     - {issue_type}: {count}")
+                lines.append(f"     - {issue_type}: {count}")
 
         if summary.get('critical_frames'):
-            print(f"  ⚠️  Critical Frames: {len(summary['critical_frames'])}")
+            lines.append(f"  ⚠️  Critical Frames: {len(summary['critical_frames'])}")
             if len(summary['critical_frames']) <= 10:
-                print(f"     Frames: {summary['critical_frames']}")
+                lines.append(f"     Frames: {summary['critical_frames']}")
             else:
-                print(f"     First 10: {summary['critical_frames'][:10]}...")
+                lines.append(f"     First 10: {summary['critical_frames'][:10]}...")
 
         # Get correction suggestions
         suggestions = analyzer.suggest_corrections(issues, player_data)
         if suggestions:
-            print(f"  💡 Suggested Corrections: {len(suggestions)} frames")
+            lines.append(f"  💡 Suggested Corrections: {len(suggestions)} frames")
             for frame_idx, reason in suggestions[:5]:
-                print(f"     - Frame {frame_idx}: {reason}")
+                lines.append(f"     - Frame {frame_idx}: {reason}")
 
         # Quality assessment
-        print(f"\n  Assessment:")
+        lines.append(f"\n  Assessment:")
         if quality_score >= 0.8:
-            print(f"     ✅ Excellent tracking quality - minimal corrections needed")
+            lines.append(f"     ✅ Excellent tracking quality - minimal corrections needed")
         elif quality_score >= 0.6:
-            print(f"     ⚠️  Good tracking - some corrections recommended")
+            lines.append(f"     ⚠️  Good tracking - some corrections recommended")
         elif quality_score >= 0.4:
-            print(f"     ⚠️  Fair tracking - corrections needed")
+            lines.append(f"     ⚠️  Fair tracking - corrections needed")
         else:
-            print(f"     ❌ Poor tracking - significant corrections required")
+            lines.append(f"     ❌ Poor tracking - significant corrections required")
+
+        print("\n".join(lines))
 
     # Step 5: Open review UI
     print("\n" + "=" * 70)
@@ -10,6 +10,29 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Shared across tests; created lazily so test_imports still reports
+# missing PyQt6/NumPy instead of failing at module load
+_APP = None
+_DUMMY_FRAME = None
+
+
+def _get_app():
+    """Return the shared QApplication, creating it on first use"""
+    global _APP
+    if _APP is None:
+        from PyQt6.QtWidgets import QApplication
+        _APP = QApplication.instance() or QApplication(sys.argv)
+    return _APP
+
+
+def _get_dummy_frame():
+    """Return the shared gray 640x480 test frame"""
+    global _DUMMY_FRAME
+    if _DUMMY_FRAME is None:
+        import numpy as np
+        _DUMMY_FRAME = np.full((480, 640, 3), 128, dtype=np.uint8)
+    return _DUMMY_FRAME
+
 
 def test_imports():
     """Test that all imports work"""
@@ -59,20 +82,16 @@ def test_bbox_editor_creation():
     print("=" * 70)
 
     try:
-        from PyQt6.QtWidgets import QApplication
         from src.ui.bbox_editor import BboxEditor
-        import numpy as np
 
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
+        app = _get_app()
 
         print("\n1. Creating BboxEditor widget...")
         editor = BboxEditor()
         print("   ✅ BboxEditor created")
 
         print("\n2. Testing set_frame with dummy frame...")
-        dummy_frame = np.ones((480, 640, 3), dtype=np.uint8) * 128  # Gray frame
+        dummy_frame = _get_dummy_frame()  # Gray frame
         editor.set_frame(dummy_frame, bbox=(100, 100, 150, 200))
         print("   ✅ Frame set successfully")
 
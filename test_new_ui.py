@@ -7,14 +7,24 @@ import sys
 import os
 import shutil
 
-# FORCE CLEAN: Delete all __pycache__ before loading
-print("🧹 Cleaning Python cache...")
-for root, dirs, files in os.walk('.'):
-    if '__pycache__' in dirs:
-        cache_path = os.path.join(root, '__pycache__')
-        shutil.rmtree(cache_path)
-        print(f"  Deleted: {cache_path}")
-print("✅ Cache cleaned\n")
+# Let OpenCV's FFmpeg backend decode with all cores (must be set before cv2
+# is imported). Gains are largest for H.264/HEVC.
+os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", "threads;0")
+
+import numpy as np
+
+# Optional clean: set MARKME_CLEAN_CACHE=1 to delete the project's
+# __pycache__ dirs before loading. Only src/ is walked, never a venv.
+if os.environ.get('MARKME_CLEAN_CACHE'):
+    print("🧹 Cleaning Python cache...")
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+    for root, dirs, files in os.walk(src_dir):
+        if '__pycache__' in dirs:
+            cache_path = os.path.join(root, '__pycache__')
+            shutil.rmtree(cache_path)
+            dirs.remove('__pycache__')
+            print(f"  Deleted: {cache_path}")
+    print("✅ Cache cleaned\n")
 
 from PyQt6.QtWidgets import QApplication, QFileDialog, QMessageBox
 from src.tracking.tracker_manager import TrackerManager
@@ -59,17 +69,20 @@ def main():
                 player = tracker_manager.players.get(player_id)
                 player_name = player.name if player else player_id
 
-                frames_tracked = len([f for f in player_data.values() if f.get('bbox') is not None])
+                # One pass: confidences of the frames that have a bbox
+                confidences = np.fromiter(
+                    (f.get('confidence', 0) for f in player_data.values() if f.get('bbox') is not None),
+                    dtype=np.float64
+                )
+                frames_tracked = confidences.size
                 total_frames = len(player_data)
 
                 print(f"\nPlayer: {player_name}")
                 print(f"  Frames tracked: {frames_tracked}/{total_frames}")
 
-                if player_data:
-                    confidences = [f.get('confidence', 0) for f in player_data.values() if f.get('bbox')]
-                    if confidences:
-                        avg_conf = sum(confidences) / len(confidences)
-                        print(f"  Average confidence: {avg_conf:.2f}")
+                if frames_tracked:
+                    avg_conf = confidences.mean()
+                    print(f"  Average confidence: {avg_conf:.2f}")
 
             QMessageBox.information(
                 None,
@@ -83,8 +96,10 @@ def main():
 
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        # Full stack trace only when debugging (MARKME_DEBUG=1)
+        if os.environ.get('MARKME_DEBUG'):
+            import traceback
+            traceback.print_exc()
 
         QMessageBox.critical(
             None,
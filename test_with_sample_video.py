@@ -9,6 +9,17 @@ and tests the tracking system on it.
 
 import sys
 import os
+import queue
+import subprocess
+import tempfile
+import threading
+import time
+
+# Let OpenCV's FFmpeg backend decode with all cores (must be set before cv2
+# is imported). Gains are largest for inter-frame codecs like H.264/HEVC;
+# the intra-only MJPEG sample video benefits less.
+os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", "threads;0")
+
 import cv2
 import numpy as np
 
@@ -24,62 +35,211 @@ def create_sample_video(output_path: str, duration_seconds: int = 5):
     """
     Create a sample video with a moving rectangle
     יצירת וידאו לדוגמה עם מלבן נע
+
+    The encoder is flushed and closed in the background. Returns
+    (initial_bbox, finish); call finish() before opening the video.
     """
     print(f"Creating sample video: {output_path}")
 
-    # Video parameters
+    # Video parameters. 320x240 is plenty for a smoke test; set
+    # SAMPLE_VIDEO_FULL_RES=1 to generate 640x480 when benchmarking.
     fps = 30
-    width, height = 640, 480
+    scale = 2 if os.environ.get("SAMPLE_VIDEO_FULL_RES") == "1" else 1
+    width, height = 320 * scale, 240 * scale
     total_frames = fps * duration_seconds
 
-    # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+    # Pipe raw BGR frames into an FFmpeg MJPEG encoder (intra-only, cheap to
+    # decode) so encoding overlaps frame synthesis; fall back to OpenCV's
+    # MJPG writer when FFmpeg is not installed. FFmpeg's stderr goes to a
+    # temp file (a pipe could fill up and stall the encoder) for error reports
+    writer = None
+    encoder_log = tempfile.TemporaryFile()
+    try:
+        encoder = subprocess.Popen(
+            [
+                'ffmpeg', '-y',
+                '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+                '-s', f'{width}x{height}', '-r', str(fps),
+                '-i', '-',
+                '-c:v', 'mjpeg', '-q:v', '3', '-threads', '0',
+                '-pix_fmt', 'yuvj420p',
+                output_path
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=encoder_log
+        )
+    except FileNotFoundError:
+        encoder = None
+        encoder_log.close()
+        fourcc = cv2.VideoWriter_fourcc(*'MJPG')
+        writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
 
     # Rectangle properties
-    rect_w, rect_h = 60, 100
-    start_x = 50
-
+    rect_w, rect_h = 30 * scale, 50 * scale
+    start_x = 25 * scale
+
+    # Light gray background, copied into a reused frame buffer each frame
+    background = np.full((height, width, 3), 200, dtype=np.uint8)
+
+    # Encoding runs on a writer thread so it overlaps frame synthesis.
+    # Frames cycle through a ring of buffers larger than the queue, so a
+    # buffer is never redrawn while it is still queued or being written.
+    frame_queue = queue.Queue(maxsize=8)
+    frame_buffers = [np.empty_like(background) for _ in range(frame_queue.maxsize + 2)]
+    write_errors = []
+
+    def write_frames():
+        while True:
+            out = frame_queue.get()
+            if out is None:
+                break
+            if write_errors:
+                continue  # Keep draining so the producer never blocks
+            try:
+                if encoder is not None:
+                    encoder.stdin.write(out.data)
+                else:
+                    writer.write(out)
+            except Exception as e:
+                write_errors.append(e)
+
+        # Flushing the muxer can take a while; it runs here rather than on
+        # the caller's thread
+        try:
+            if encoder is not None:
+                try:
+                    encoder.stdin.close()
+                except BrokenPipeError:
+                    pass  # FFmpeg already exited; its return code says why
+                if encoder.wait() != 0:
+                    encoder_log.seek(0)
+                    message = encoder_log.read().decode(errors='replace').strip()
+                    raise RuntimeError(f"ffmpeg exited with code {encoder.returncode}: {message}")
+            else:
+                writer.release()
+        except Exception as e:
+            # Report the encoder's own failure ahead of the broken-pipe
+            # write errors it caused
+            write_errors.insert(0, e)
+        finally:
+            if encoder is not None:
+                encoder_log.close()
+
+    writer_thread = threading.Thread(target=write_frames, daemon=True)
+
+    # Rectangle path for all frames: left to right with a vertical sine wave
+    progress = np.arange(total_frames) / total_frames
+    xs = (start_x + (width - start_x - rect_w) * progress).astype(np.int32)
+    ys = height // 2 - rect_h // 2 + (25 * scale * np.sin(progress * 4 * np.pi)).astype(np.int32)
+
+    # Noise/distraction circle centers for all frames, 5 per frame, from a
+    # fixed-seed generator so every run produces the same video
+    rng = np.random.default_rng(0)
+    noise = rng.integers(0, [width - 20, height - 20], size=(total_frames, 5, 2), dtype=np.int32)
+
+    # Green noise disk rasterized once; it is pasted through its mask, with
+    # the top-left clipping of circles near the frame edge computed up front
+    noise_radius = 10
+    noise_sprite = np.zeros((2 * noise_radius + 1, 2 * noise_radius + 1, 3), dtype=np.uint8)
+    cv2.circle(noise_sprite, (noise_radius, noise_radius), noise_radius, (0, 255, 0), -1)
+    noise_mask = noise_sprite.any(axis=2)
+    noise_corner = noise - noise_radius
+    noise_clip = np.maximum(-noise_corner, 0)
+    noise_corner += noise_clip
+
+    # Frame-number label: rasterize "Frame " and each digit once as
+    # anti-aliased coverage tiles instead of calling cv2.putText per frame.
+    # Hershey digits share one advance, so digit tiles are pasted at
+    # multiples of it; each frame only multiplies the label strip.
+    font, font_scale, thickness = cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2
+    label_origin, label_h = (10, 30), 40
+    label_w = min(width, label_origin[0] + thickness + 10 +
+                  cv2.getTextSize(f"Frame {total_frames}", font, font_scale, thickness)[0][0])
+
+    def text_coverage(text):
+        strip = np.zeros((label_h, label_w), dtype=np.uint8)
+        cv2.putText(strip, text, label_origin, font, font_scale, 255, thickness)
+        return strip.astype(np.float32) / 255
+
+    # The space after "Frame" keeps the digit strokes clear of the prefix
+    prefix_coverage = text_coverage("Frame ")
+    prefix_keep = 1 - prefix_coverage
+    digit_keep = {d: 1 - (text_coverage("Frame " + d) - prefix_coverage) for d in "0123456789"}
+    digit_advance = (cv2.getTextSize("00", font, font_scale, thickness)[0][0]
+                     - cv2.getTextSize("0", font, font_scale, thickness)[0][0])
+
+    writer_thread.start()
     for frame_idx in range(total_frames):
-        # Create blank frame
-        frame = np.ones((height, width, 3), dtype=np.uint8) * 200  # Light gray background
-
-        # Calculate rectangle position (moves from left to right)
-        progress = frame_idx / total_frames
-        x = int(start_x + (width - start_x - rect_w) * progress)
-        y = height // 2 - rect_h // 2
-
-        # Add some vertical movement (sine wave)
-        y += int(50 * np.sin(progress * 4 * np.pi))
+        frame = frame_buffers[frame_idx % len(frame_buffers)]
+        np.copyto(frame, background)
 
         # Draw moving rectangle (blue)
+        x, y = int(xs[frame_idx]), int(ys[frame_idx])
         cv2.rectangle(frame, (x, y), (x + rect_w, y + rect_h), (255, 0, 0), -1)
 
         # Add some noise/distraction
-        for _ in range(5):
-            noise_x = np.random.randint(0, width - 20)
-            noise_y = np.random.randint(0, height - 20)
-            cv2.circle(frame, (noise_x, noise_y), 10, (0, 255, 0), -1)
+        for (x0, y0), (cx, cy) in zip(noise_corner[frame_idx].tolist(), noise_clip[frame_idx].tolist()):
+            mask = noise_mask[cy:, cx:]
+            frame[y0:y0 + mask.shape[0], x0:x0 + mask.shape[1]][mask] = (0, 255, 0)
 
-        # Add frame number
-        cv2.putText(frame, f"Frame {frame_idx}", (10, 30),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 2)
+        # Add frame number (black)
+        keep = prefix_keep.copy()
+        for i, digit in enumerate(str(frame_idx)):
+            offset = i * digit_advance
+            keep[:, offset:] *= digit_keep[digit][:, :label_w - offset]
+        label = frame[:label_h, :label_w]
+        np.multiply(label, keep[..., None], out=label, casting='unsafe')
 
-        writer.write(frame)
+        frame_queue.put(frame)
 
         if frame_idx % 30 == 0:
             print(f"  Generated {frame_idx}/{total_frames} frames", end='\r')
 
-    writer.release()
-    print(f"\n✅ Sample video created: {output_path}")
-    print(f"   Frames: {total_frames}, FPS: {fps}, Duration: {duration_seconds}s")
+    frame_queue.put(None)
+
+    def finish():
+        """Wait until the video file is complete"""
+        writer_thread.join()
+        if write_errors:
+            raise write_errors[0]
+        print(f"\n✅ Sample video created: {output_path}")
+        print(f"   Frames: {total_frames}, FPS: {fps}, Duration: {duration_seconds}s")
 
     # Return initial bbox for tracking
     initial_bbox = (start_x, height // 2 - rect_h // 2, rect_w, rect_h)
-    return initial_bbox
+    return initial_bbox, finish
 
 
-def test_with_sample_video():
+def warm_page_cache(path: str):
+    """
+    Ask the OS to prefetch a file into the page cache before it is read.
+    Uses posix_fadvise where available; otherwise reads it in a
+    background thread and discards the data.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        os.close(fd)
+        return
+    except (AttributeError, OSError):
+        os.close(fd)
+
+    def read_file():
+        try:
+            with open(path, 'rb') as f:
+                while f.read(1 << 20):
+                    pass
+        except OSError:
+            pass
+
+    threading.Thread(target=read_file, daemon=True).start()
+
+
+def test_with_sample_video(frame_stride: int = 1):
     """
     Test tracking system with generated sample video
     בדיקת מערכת מעקב עם וידאו לדוגמה
@@ -90,12 +250,14 @@ def test_with_sample_video():
     print("=" * 70)
 
     # Create sample video
-    sample_video_path = "/tmp/sample_tracking_video.mp4"
+    sample_video_path = "/tmp/sample_tracking_video.avi"
     print("\n📹 Step 1: Creating sample video...")
-    initial_bbox = create_sample_video(sample_video_path, duration_seconds=5)
+    initial_bbox, finish_video = create_sample_video(sample_video_path, duration_seconds=5)
 
-    # Create Qt application
+    # Create Qt application while the video is still being finalized
     app = QApplication(sys.argv)
+    finish_video()
+    warm_page_cache(sample_video_path)
 
     # Load video
     print("\n📹 Step 2: Loading sample video...")
@@ -118,11 +280,29 @@ def test_with_sample_video():
 
     # Generate tracking data
     print("\n🎯 Step 4: Generating tracking data...")
+    progress = {'time': 0.0, 'latest': None}
+
+    def show_progress(curr, total):
+        print(f"  Progress: {curr}/{total}", end='\r', flush=True)
+
+    def print_progress(curr, total):
+        # Refresh at most 10 times a second - a terminal write per frame slows
+        # fast trackers. The final count is printed after tracking returns,
+        # since with frame_stride > 1 curr may never reach total
+        progress['latest'] = (curr, total)
+        now = time.monotonic()
+        if now - progress['time'] >= 0.1:
+            progress['time'] = now
+            show_progress(curr, total)
+
     tracking_data = tracker_manager.generate_tracking_data(
         start_frame=0,
         end_frame=tracker_manager.total_frames - 1,
-        progress_callback=lambda curr, total: print(f"  Progress: {curr}/{total}", end='\r')
+        progress_callback=print_progress,
+        frame_stride=frame_stride
     )
+    if progress['latest']:
+        show_progress(*progress['latest'])  # Final count
     print(f"\n✅ Tracking complete!")
 
     # Open review UI